@@ -186,7 +186,7 @@ def calculate_contacts(
         contact_label = (
             str(res1) + res1_name + " " + str(res2) + res2_name + " " + interaction_type
         )
-        contact_labels_scores.update({contact_label: contact_scores})
+        contact_labels_scores[contact_label] = contact_scores
 
     # reorders column names, to be like the old format.
     sorted_dict = dict(
@@ -234,7 +234,7 @@ class _SupervisedRunner(_MachineLearnModel):
                     Path.mkdir(temp_folder)
 
                 feat_names_file = Path(temp_folder, "feature_names.npy")
-                np.save(feat_names_file, self.feat_names)
+                np.save(feat_names_file, self.feat_names.astype(str))
 
                 model_file_name = str(model_name) + "_Model.pickle"
                 model_out_path = Path(temp_folder, model_file_name)
@@ -597,22 +597,21 @@ class ClassificationModel(_SupervisedRunner):
             # now reformat report so dataframe friendly.
             new_report = {}
             for label in class_labels:
-                new_report.update({label: report[label]})
+                new_report[label] = report[label]
 
             accuracy_row = {
                 "precision": "N/A", "recall": "N/A",
                 "f1-score": report["accuracy"],
                 "support": report["weighted avg"]["support"]
             }
-            new_report.update({"accuracy": accuracy_row})
+            new_report["accuracy"] = accuracy_row
 
-            new_report.update({"macro avg": report["macro avg"]})
-            new_report.update({"weighted avg": report["weighted avg"]})
+            new_report["macro avg"] = report["macro avg"]
+            new_report["weighted avg"] = report["weighted avg"]
 
             df_classification_report = pd.DataFrame(new_report).transpose()
 
-            all_classification_reports.update(
-                {model_name: df_classification_report})
+            all_classification_reports[model_name] = df_classification_report
 
         print("Returning classification reports for each model inside a single dictionary")
         return all_classification_reports
@@ -640,7 +639,7 @@ class ClassificationModel(_SupervisedRunner):
             confuse_matrix = metrics.confusion_matrix(
                 y_true_decoded, yhat_decoded)
 
-            confusion_matrices.update({model_name: confuse_matrix})
+            confusion_matrices[model_name] = confuse_matrix
 
         return confusion_matrices
 
@@ -959,7 +958,7 @@ class UnsupervisedModel(_MachineLearnModel):
                 Path.mkdir(temp_folder)
 
             feat_names_file = Path(temp_folder, "feature_names.npy")
-            np.save(feat_names_file, self.feat_names)
+            np.save(feat_names_file, self.feat_names.astype(str))
 
             model_out_path = Path(temp_folder, "PCA_Model.pickle")
             self._save_best_models(best_model=pca, out_path=model_out_path)
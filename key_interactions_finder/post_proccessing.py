@@ -21,10 +21,12 @@ Whatever feature has the highest average score is chosen (warning, very approxim
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Optional, Sequence, Tuple, Union
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import warnings
-import csv
+import re
+import string
 import pickle
 import pandas as pd
 import numpy as np
@@ -32,20 +34,33 @@ from key_interactions_finder.utils import _prep_out_dir
 from key_interactions_finder.model_building import ClassificationModel, RegressionModel, UnsupervisedModel
 from key_interactions_finder.stat_modelling import ClassificationStatModel, RegressionStatModel
 
+# First number in each of the first two words of a feature name is its residue number.
+_RESIDUE_PAIR_PATTERN = re.compile(r"\D*(\d+)\S*\s+\D*(\d+)")
+
+# Results files are written through a 1 MiB buffer, so each file takes only a few writes.
+_CSV_BUFFER_SIZE = 1024 * 1024
+
 
 @dataclass
 class PostProcessor(ABC):
     """Abstract base class to unify the different postprocessing classes."""
+    # Residue numbers of each feature and the feature names they were parsed from.
+    _residue_numbers: Optional[Tuple[np.ndarray, np.ndarray]] = field(
+        init=False, default=None, repr=False)
+    _parsed_feat_names: Optional[Sequence[str]] = field(init=False, default=None, repr=False)
 
     @abstractmethod
     def get_per_res_scores(self, save_result):
         """Projects the per feature scores onto the per-residue level."""
 
-    @staticmethod
-    def _dict_to_df_feat_scores(feat_scores: dict) -> pd.DataFrame:
+    def _dict_to_residue_arrays(self,
+                                feat_scores: dict,
+                                feat_names: Sequence[str]
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Convert a dictionary of features and feature scores to a dataframe of 3 columns,
+        Convert a dictionary of features and feature scores to 3 arrays,
         which are: (1) the first residue, (2) the second residue and (3) the score.
+        All 3 arrays are in the same order as feat_names.
         Used as a helper function for converting from per feature scores to per residues scores.
 
         Parameters
@@ -54,38 +69,116 @@ class PostProcessor(ABC):
         feat_scores : dict
             Contains each feature name (keys) and their corresponding score (values).
 
+        feat_names : Sequence[str]
+            All feature names, in feature index order.
+
         Returns
         ----------
 
-        pd.DataFrame
-            dataframe of residue numbers and scores for each feature.
+        np.ndarray
+            First residue number of each feature.
+
+        np.ndarray
+            Second residue number of each feature.
+
+        np.ndarray
+            Score of each feature.
         """
-        df_feat_import = pd.DataFrame(feat_scores.items())
-        df_feat_import_res = df_feat_import[0].str.split(" +", expand=True)
+        res1, res2 = self._get_residue_numbers(feat_names)
+        scores = np.fromiter(
+            (feat_scores[feat_name] for feat_name in feat_names),
+            dtype=np.float64, count=len(feat_names))
 
-        res1, res2, values = [], [], []
-        res1 = (df_feat_import_res[0].str.extract(r"(\d+)")).astype(int)
-        res2 = (df_feat_import_res[1].str.extract(r"(\d+)")).astype(int)
-        # absolute values required as want to be able to sum linear correlations.
-        values = df_feat_import[1].abs()
+        return res1, res2, scores
 
-        per_res_import = pd.concat(
-            [res1, res2, values], axis=1, join="inner")
-        per_res_import.columns = ["Res1", "Res2", "Score"]
+    def _get_residue_numbers(self, feat_names: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the residue numbers of each feature, in the same order as feat_names.
 
-        return per_res_import
+        All models (and statistical methods) score the same features, so the names are
+        only parsed on the first call and reused for as long as the same feature names
+        are passed in.
+
+        Parameters
+        ----------
+
+        feat_names : Sequence[str]
+            All feature names, in feature index order.
+
+        Returns
+        ----------
+
+        np.ndarray
+            First residue number of each feature.
+
+        np.ndarray
+            Second residue number of each feature.
+        """
+        if self._parsed_feat_names is not feat_names:
+            self._residue_numbers = self._parse_residue_numbers(feat_names)
+            self._parsed_feat_names = feat_names
+
+        return self._residue_numbers
 
     @staticmethod
-    def _per_res_scores(per_res_import: pd.DataFrame) -> dict:
+    def _parse_residue_numbers(feat_names: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse the residue numbers from each feature name.
+
+        Parameters
+        ----------
+
+        feat_names : list
+            Feature names to parse.
+
+        Returns
+        ----------
+
+        np.ndarray
+            First residue number of each feature.
+
+        np.ndarray
+            Second residue number of each feature.
+        """
+        res1 = np.empty(len(feat_names), dtype=np.int32)
+        res2 = np.empty(len(feat_names), dtype=np.int32)
+        for idx, feat_name in enumerate(feat_names):
+            # Names normally follow the "12Ala 15Glu ..." template, which can be split
+            # directly, the regex is only needed for anything else.
+            words = feat_name.split(maxsplit=2)
+            if len(words) >= 2:
+                res1_num = words[0].rstrip(string.ascii_letters)
+                res2_num = words[1].rstrip(string.ascii_letters)
+                if res1_num.isdigit() and res2_num.isdigit():
+                    res1[idx] = int(res1_num)
+                    res2[idx] = int(res2_num)
+                    continue
+
+            res_match = _RESIDUE_PAIR_PATTERN.match(feat_name)
+            if res_match is None:
+                raise ValueError(
+                    f"Could not determine the two residue numbers of the feature: {feat_name}")
+            res1[idx] = int(res_match[1])
+            res2[idx] = int(res_match[2])
+
+        return res1, res2
+
+    @staticmethod
+    def _per_res_scores(res1: np.ndarray, res2: np.ndarray, scores: np.ndarray) -> dict:
         """
         Sums all per features scores to determine the per residue score for each residue.
 
         Parameters
         ----------
 
-        per_res_import : pd.DataFrame
-            Dataframe with columns of both residues numbers and their
-            corresponding per feature score.
+        res1 : np.ndarray
+            First residue number of each feature.
+
+        res2 : np.ndarray
+            Second residue number of each feature.
+
+        scores : np.ndarray
+            Score of each feature.
 
         Returns
         ----------
@@ -93,29 +186,67 @@ class PostProcessor(ABC):
         dict
             Keys are each residue, values are the residue's relative score.
         """
-        max_res = max(per_res_import[["Res1", "Res2"]].max())
-        res_ids = []
-        tot_scores = []
-        for i in range(1, max_res+1, 1):
-            res_ids.append(i + 1)
-            tot_scores.append(
-                per_res_import.loc[per_res_import["Res1"] == i, "Score"].sum() +
-                per_res_import.loc[per_res_import["Res2"] == i, "Score"].sum())
+        # absolute values required as want to be able to sum linear correlations.
+        # NaN scores (e.g. the linear correlation of a constant feature) are skipped,
+        # as they were when the scores were summed with pandas.
+        scores = np.abs(scores)
+        scores[np.isnan(scores)] = 0.0
+        max_res = int(max(res1.max(), res2.max()))
+
+        # Each feature contributes its score to both of its residues.
+        # Index i of tot_scores is the summed score of residue number i.
+        tot_scores = np.bincount(res1, weights=scores, minlength=max_res+1)
+        tot_scores += np.bincount(res2, weights=scores, minlength=max_res+1)
 
         # Rescale scores so that new largest has size 1.0
         # (good for PyMOL sphere representation as well).
-        max_ori_score = max(tot_scores)
-        tot_scores_scaled = []
-        for i in range(1, max_res, 1):
-            tot_scores_scaled.append(tot_scores[i] / max_ori_score)
+        res_ids = np.arange(1, max_res+1)
+        tot_scores_scaled = np.around(tot_scores[1:] / tot_scores[1:].max(), 5)
 
-        spheres = dict(sorted(zip(
-            res_ids, tot_scores_scaled), key=lambda x: x[1], reverse=True))
+        return PostProcessor._sorted_dict(res_ids, tot_scores_scaled)
 
-        spheres = {keys: np.around(values, 5)
-                   for keys, values in spheres.items()}
+    @staticmethod
+    def _sorted_dict(keys: np.ndarray, values: np.ndarray) -> dict:
+        """
+        Build a dictionary ordered from the highest to the lowest value.
+        Keys with tied values keep their original order.
 
-        return spheres
+        Parameters
+        ----------
+
+        keys : np.ndarray
+            Keys of the dictionary (e.g. feature names or residue numbers).
+
+        values : np.ndarray
+            Value for each key, used for the ordering.
+
+        Returns
+        ----------
+
+        dict
+            Keys and values, ordered by descending value.
+        """
+        sort_order = np.argsort(-values, kind="stable")
+        return dict(zip(keys[sort_order].tolist(), values[sort_order].tolist()))
+
+    @staticmethod
+    def _df_to_csv(df_to_save: pd.DataFrame, out_file: Path) -> None:
+        """
+        Write a dataframe (without its index) to a csv file.
+        Rows end in "\\r\\n" (the same as the csv module writes).
+
+        Parameters
+        ----------
+
+        df_to_save : pd.DataFrame
+            Dataframe to write to disk.
+
+        out_file : Path
+            The full path to write the file too.
+        """
+        with open(out_file, "w", newline="", encoding="utf-8",
+                  buffering=_CSV_BUFFER_SIZE) as file_out:
+            df_to_save.to_csv(file_out, index=False, lineterminator="\r\n")
 
     @staticmethod
     def _per_feature_scores_to_file(feature_scores: dict, out_file: Path) -> None:
@@ -131,12 +262,14 @@ class PostProcessor(ABC):
         out_file : Path
             The full path to write the file too.
         """
-        with open(out_file, "w", newline="", encoding="utf-8") as out:
-            csv_out = csv.writer(out)
-            csv_out.writerow(["Feature", "Score"])
-            for key, value in feature_scores.items():
-                csv_out.writerow([key, np.around(value, 4)])
-            print(f"{out_file} written to disk.")
+        scores = np.fromiter(
+            feature_scores.values(), dtype=np.float64, count=len(feature_scores))
+        df_feature_scores = pd.DataFrame({
+            "Feature": list(feature_scores.keys()),
+            "Score": np.around(scores, 4)
+        })
+        PostProcessor._df_to_csv(df_feature_scores, out_file)
+        print(f"{out_file} written to disk.")
 
     @staticmethod
     def _per_res_scores_to_file(per_res_values: dict, out_file: Path) -> None:
@@ -152,11 +285,12 @@ class PostProcessor(ABC):
         out_file : Path
             The full path to write the file too.
         """
-        with open(out_file, "w", newline="", encoding="utf-8") as file_out:
-            csv_out = csv.writer(file_out)
-            csv_out.writerow(["Residue Number", "Normalised Score"])
-            csv_out.writerows(per_res_values.items())
-            print(f"{out_file} written to disk.")
+        df_per_res_scores = pd.DataFrame({
+            "Residue Number": list(per_res_values.keys()),
+            "Normalised Score": list(per_res_values.values())
+        })
+        PostProcessor._df_to_csv(df_per_res_scores, out_file)
+        print(f"{out_file} written to disk.")
 
 
 @dataclass
@@ -280,15 +414,23 @@ class SupervisedPostProcessor(PostProcessor):
         feat_names_file = Path(temp_folder, "feature_names.npy")
 
         try:
-            self.feat_names = np.load(feat_names_file, allow_pickle=True)
-
-            self.best_models = {}
-            for model_name in models_to_use:
-                model_file_name = str(model_name) + "_Model.pickle"
-                model_in_path = Path(temp_folder, model_file_name)
-
-                model = pickle.load(open(model_in_path, 'rb'))
-                self.best_models.update({model_name: model})
+            try:
+                self.feat_names = np.load(feat_names_file)
+            except ValueError:
+                # Older versions saved the feature names as a pickled object array.
+                self.feat_names = np.load(feat_names_file, allow_pickle=True)
+
+            model_in_paths = [
+                Path(temp_folder, f"{model_name}_Model.pickle")
+                for model_name in models_to_use
+            ]
+            # Unpickling one saved model does not depend on another, so load them together.
+            # An empty model list still needs one worker for the executor to start.
+            n_workers = max(1, min(4, len(model_in_paths)))
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                models = list(executor.map(self._load_model_file, model_in_paths))
+
+            self.best_models = dict(zip(models_to_use, models))
 
         except FileNotFoundError:
             error_message = "I cannot find the files you generated from a prior " + \
@@ -297,6 +439,21 @@ class SupervisedPostProcessor(PostProcessor):
                 "should see a folder named: 'temporary_files' if you are."
             raise FileNotFoundError(error_message)
 
+    @staticmethod
+    def _load_model_file(model_in_path: Path):
+        """Loads a single machine learning model from disk."""
+        with open(model_in_path, "rb") as file_in:
+            return pickle.load(file_in)
+
+    @staticmethod
+    def _get_model_feature_scores(model) -> np.ndarray:
+        """
+        Gets the feature importances of a model, in the same order as self.feat_names.
+        Some models (e.g. XGBoost) give float32 importances, which are cast to float64
+        before rounding so the rounded values are exact.
+        """
+        return np.around(model.feature_importances_.astype(np.float64), 8)
+
     def get_per_feature_scores(self, save_result: bool = True) -> None:
         """
         Gets the per feature scores and saves them to disk.
@@ -310,14 +467,11 @@ class SupervisedPostProcessor(PostProcessor):
         """
         self.all_per_feature_scores = {}
         for model_name, model in self.best_models.items():
-            raw_scores = list(np.around(model.feature_importances_, 8))
-            feat_scores = zip(self.feat_names, raw_scores)
-            sort_feat_scores = dict(sorted(
-                feat_scores, key=lambda x: x[1], reverse=True))
+            raw_scores = self._get_model_feature_scores(model)
+            sort_feat_scores = self._sorted_dict(self.feat_names, raw_scores)
 
             if save_result:
-                model_file_name = str(model_name) + "_Feature_Scores.csv"
-                out_file_path = Path(self.out_dir, model_file_name)
+                out_file_path = Path(self.out_dir, f"{model_name}_Feature_Scores.csv")
 
                 self._per_feature_scores_to_file(
                     feature_scores=sort_feat_scores,
@@ -325,8 +479,7 @@ class SupervisedPostProcessor(PostProcessor):
                 )
 
             # Add to the class.
-            self.all_per_feature_scores.update(
-                {model_name: sort_feat_scores})
+            self.all_per_feature_scores[model_name] = sort_feat_scores
 
         print("All per feature scores have now been saved to disk.")
 
@@ -345,16 +498,15 @@ class SupervisedPostProcessor(PostProcessor):
         if len(self.all_per_feature_scores) == 0:
             self.get_per_feature_scores()
 
+        res1, res2 = self._get_residue_numbers(self.feat_names)
+
         self.all_per_residue_scores = {}
-        for model_name, feat_scores in self.all_per_feature_scores.items():
-            per_res_import = (
-                self._dict_to_df_feat_scores(feat_scores))
-            spheres = self._per_res_scores(per_res_import)
+        for model_name, model in self.best_models.items():
+            spheres = self._per_res_scores(
+                res1, res2, self._get_model_feature_scores(model))
 
             if save_result:
-                model_file_name = str(model_name) + \
-                    "_Per_Residue_Scores.csv"
-                out_file_path = Path(self.out_dir, model_file_name)
+                out_file_path = Path(self.out_dir, f"{model_name}_Per_Residue_Scores.csv")
 
                 self._per_res_scores_to_file(
                     per_res_values=spheres,
@@ -362,7 +514,7 @@ class SupervisedPostProcessor(PostProcessor):
                 )
 
             # Save to Class.
-            self.all_per_residue_scores.update({model_name: spheres})
+            self.all_per_residue_scores[model_name] = spheres
 
         print("All per residue scores have now been saved to disk.")
 
@@ -444,8 +596,7 @@ class UnsupervisedPostProcessor(PostProcessor):
         if save_result:
             for model_name, feat_scores in self.all_per_feature_scores.items():
 
-                model_file_name = str(model_name) + "_Per_Feature_Scores.csv"
-                out_file_path = Path(self.out_dir, model_file_name)
+                out_file_path = Path(self.out_dir, f"{model_name}_Per_Feature_Scores.csv")
 
                 self._per_feature_scores_to_file(
                     feature_scores=feat_scores,
@@ -470,14 +621,11 @@ class UnsupervisedPostProcessor(PostProcessor):
 
         self.all_per_residue_scores = {}
         for model_name, feat_scores in self.all_per_feature_scores.items():
-            per_res_import = (
-                self._dict_to_df_feat_scores(feat_scores))
-            spheres = self._per_res_scores(per_res_import)
+            spheres = self._per_res_scores(*self._dict_to_residue_arrays(
+                feat_scores, self.unsupervised_model.feat_names))
 
             if save_result:
-                model_file_name = str(model_name) + \
-                    "_Per_Residue_Scores.csv"
-                out_file_path = Path(self.out_dir, model_file_name)
+                out_file_path = Path(self.out_dir, f"{model_name}_Per_Residue_Scores.csv")
 
                 self._per_res_scores_to_file(
                     per_res_values=spheres,
@@ -485,7 +633,7 @@ class UnsupervisedPostProcessor(PostProcessor):
                 )
 
             # Save to Class
-            self.all_per_residue_scores.update({model_name: spheres})
+            self.all_per_residue_scores[model_name] = spheres
 
         print("All per residue scores have now been saved to disk.")
 
@@ -522,27 +670,29 @@ class UnsupervisedPostProcessor(PostProcessor):
         variances = self.unsupervised_model.ml_models["PCA"].explained_variance_ratio_
         components = self.unsupervised_model.ml_models["PCA"].components_
 
-        combined_variance = variances[0]
-        idx_position = 1
-        while combined_variance <= variance_explained_cutoff:
-            combined_variance += variances[idx_position]
-            idx_position += 1
-
-        variance_described = sum(variances[0:idx_position]) * 100
-        components_keep = components[0:idx_position]
-
-        eigenvalue_sums = []
-        for idx, _ in enumerate(components_keep):
-            eigenvalues = [eigenvalues[idx] for eigenvalues in components_keep]
-            eigenvalues_reweighted = [(eigenvalue * variances[idx])
-                                      for idx, eigenvalue in enumerate(eigenvalues)]
-
-            eigenvalue_sums.append(np.sum(np.absolute(eigenvalues_reweighted)))
+        # Number of PCs needed before the cumulative variance exceeds the cutoff.
+        cumulative_variances = np.cumsum(variances)
+        idx_position = int(np.searchsorted(
+            cumulative_variances, variance_explained_cutoff, side="right")) + 1
+        idx_position = min(idx_position, len(variances))
+
+        variance_described = cumulative_variances[idx_position-1] * 100
+        # Single precision halves the memory traffic of the reweighting below.
+        # It is not exact: near-tied features can differ in the last written (4th) decimal
+        # and swap rank order compared with a float64 reweighting.
+        components_keep = np.ascontiguousarray(
+            components[0:idx_position], dtype=np.float32)
+        variances_keep = variances[0:idx_position].astype(np.float32)
+
+        # Rows of components_keep are PCs, columns are features.
+        # Weighting each PC by its (non-negative) explained variance and summing per feature
+        # is a single vector-matrix product.
+        eigenvalue_sums = (variances_keep @ np.absolute(components_keep)).astype(np.float64)
 
         eigenvalues_scaled = self._scale_eigenvalues(eigenvalue_sums)
 
         pca_per_feat_scores = dict(
-            zip(self.unsupervised_model.feat_names, eigenvalues_scaled))
+            zip(self.unsupervised_model.feat_names, eigenvalues_scaled.tolist()))
 
         print(
             "The total variance described by the principal components (PCs) used " +
@@ -553,7 +703,7 @@ class UnsupervisedPostProcessor(PostProcessor):
         return pca_per_feat_scores
 
     @staticmethod
-    def _scale_eigenvalues(eigenvalue_sums: list) -> list:
+    def _scale_eigenvalues(eigenvalue_sums: np.ndarray) -> np.ndarray:
         """
         Scale the summed per feature eigenvalues so that the new largest sum has size 1.0.
         This is a good size for PyMOL sphere representation as well.
@@ -561,21 +711,17 @@ class UnsupervisedPostProcessor(PostProcessor):
         Parameters
         ----------
 
-        eigenvalue_sums : list
+        eigenvalue_sums : np.ndarray
             Per feature summed eigenvalues with no scaling.
 
         Returns
         ----------
 
-        list
+        np.ndarray
             Per feature summed eigenvalues now scaled.
         """
-        max_eigen_value = max(eigenvalue_sums)
-        eigenvalues_scaled = []
-        for ori_eigenvalue in eigenvalue_sums:
-            eigenvalues_scaled.append(ori_eigenvalue / max_eigen_value)
-
-        return eigenvalues_scaled
+        eigenvalue_sums = np.asarray(eigenvalue_sums, dtype=np.float64)
+        return eigenvalue_sums / eigenvalue_sums.max()
 
 
 @dataclass
@@ -665,10 +811,9 @@ class StatClassificationPostProcessor(PostProcessor):
             Dictionary of each residue and it's relative score.
         """
         if stat_method == "mutual_information":
-            per_res_import = (self._dict_to_df_feat_scores(
-                self.stat_model.mutual_infos))
-            self.per_residue_mutual_infos = (
-                self._per_res_scores(per_res_import))
+            res1, res2, scores = self._dict_to_residue_arrays(
+                self.stat_model.mutual_infos, self.stat_model.feature_list)
+            self.per_residue_mutual_infos = self._per_res_scores(res1, res2, scores)
 
             if save_result:
                 model_file_name = "Mutual_Information_Scores_Per_Residue.csv"
@@ -681,10 +826,9 @@ class StatClassificationPostProcessor(PostProcessor):
             return self.per_residue_mutual_infos
 
         if stat_method == "jensen_shannon":
-            per_res_import = (self._dict_to_df_feat_scores(
-                self.stat_model.js_distances))
-            self.per_residue_js_distances = (
-                self._per_res_scores(per_res_import))
+            res1, res2, scores = self._dict_to_residue_arrays(
+                self.stat_model.js_distances, self.stat_model.feature_list)
+            self.per_residue_js_distances = self._per_res_scores(res1, res2, scores)
 
             if save_result:
                 model_file_name = "Jensen_Shannon_Distance_Scores_Per_Residue.csv"
@@ -773,27 +917,19 @@ class StatClassificationPostProcessor(PostProcessor):
         )
         warnings.warn(warning_message)
 
-        per_class_datasets = {}
-        for class_name in self.stat_model.class_names:
-            single_class_dataset = self.stat_model.scaled_dataset[(
-                self.stat_model.scaled_dataset["Target"] == class_name)]
-            per_class_datasets[class_name] = single_class_dataset.drop(columns=["Target"]) 
-
-        avg_contact_scores = {}
-        self.feature_directions = {}
-        for class_name, class_observations in per_class_datasets.items():
-            avg_contact_scores[class_name] = class_observations.mean()
+        # One row of average contact scores per class.
+        avg_contact_scores = self.stat_model.scaled_dataset.groupby(
+            "Target", sort=False).mean().reindex(self.stat_model.class_names)
 
         class_0_name = self.stat_model.class_names[0]
         class_1_name = self.stat_model.class_names[1]
 
-        for feature_name, class_0_scores in avg_contact_scores[class_0_name].items():
-            class_1_score = avg_contact_scores[class_1_name][feature_name]
+        class_0_scores = avg_contact_scores.loc[class_0_name]
+        class_1_scores = avg_contact_scores.loc[class_1_name]
 
-            if class_0_scores >= class_1_score:
-                self.feature_directions.update({feature_name: class_0_name})
-            else:
-                self.feature_directions.update({feature_name: class_1_name})
+        directions = np.where(
+            class_0_scores.to_numpy() >= class_1_scores.to_numpy(), class_0_name, class_1_name)
+        self.feature_directions = dict(zip(class_0_scores.index.tolist(), directions.tolist()))
 
         out_file_path = Path(self.out_dir, "Feature_Direction_Estimates.csv")
 
@@ -825,19 +961,20 @@ class StatClassificationPostProcessor(PostProcessor):
         out_file : Path
             Full path of file to write out.
         """
-        with open(out_file, "w", newline="", encoding="utf-8") as file_out:
-            csv_out = csv.writer(file_out)
-
-            if feature_or_residue == "features":
-                csv_out.writerow(["Feature Name", "Predicted Direction"])
-            elif feature_or_residue == "residues":
-                csv_out.writerow(["Residue Number", "Predicted Direction"])
-            else:
-                raise ValueError(
-                    "Only 'features' or 'residues' allowed for parameter 'feature_or_residue'."
-                )
-
-            csv_out.writerows(dict_to_save.items())
+        if feature_or_residue == "features":
+            first_column = "Feature Name"
+        elif feature_or_residue == "residues":
+            first_column = "Residue Number"
+        else:
+            raise ValueError(
+                "Only 'features' or 'residues' allowed for parameter 'feature_or_residue'."
+            )
+
+        df_directions = pd.DataFrame({
+            first_column: list(dict_to_save.keys()),
+            "Predicted Direction": list(dict_to_save.values())
+        })
+        PostProcessor._df_to_csv(df_directions, out_file)
         print(f"{out_file} written to disk.")
 
 
@@ -913,10 +1050,9 @@ class StatRegressorPostProcessor(PostProcessor):
             Dictionary of each residue and it's relative score.
         """
         if stat_method == "mutual_information":
-            per_res_import = (self._dict_to_df_feat_scores(
-                self.stat_model.mutual_infos))
-            self.per_residue_mutual_infos = (
-                self._per_res_scores(per_res_import))
+            res1, res2, scores = self._dict_to_residue_arrays(
+                self.stat_model.mutual_infos, self.stat_model.feature_list)
+            self.per_residue_mutual_infos = self._per_res_scores(res1, res2, scores)
 
             if save_result:
                 out_file_path = Path(
@@ -928,10 +1064,9 @@ class StatRegressorPostProcessor(PostProcessor):
             return self.per_residue_mutual_infos
 
         if stat_method == "linear_correlation":
-            per_res_import = (self._dict_to_df_feat_scores(
-                self.stat_model.linear_correlations))
-            self.per_residue_linear_correlations = (
-                self._per_res_scores(per_res_import))
+            res1, res2, scores = self._dict_to_residue_arrays(
+                self.stat_model.linear_correlations, self.stat_model.feature_list)
+            self.per_residue_linear_correlations = self._per_res_scores(res1, res2, scores)
 
             if save_result:
                 out_file_path = Path(
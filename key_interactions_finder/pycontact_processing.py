@@ -18,10 +18,31 @@ can be off by 1 residue number. If this happens to you, you can use the
 function "modify_column_residue_numbers" to edit/renumber all the features in your dataframe.
 """
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import re
 from typing import Union, Optional
 from dataclasses import dataclass, field
 import pandas as pd
+import numpy as np
+
+# Both residues of a PyContact GUI feature and its interaction type, e.g. "ASP123-ARG456Hbond".
+# A residue's name is its first run of letters and its number its first run of digits, in
+# either order. The interaction type is the next whole run of letters after the second
+# residue's name, so it is never split from a residue name it is not separated from.
+_GUI_FEATURE_PATTERN = (
+    # First residue, everything before the first "-".
+    r"^(?=[^-A-Za-z]*(?P<res1_name>[A-Za-z]+))(?=[^-\d]*(?P<res1_numb>\d+))[^-]*-"
+    # Second residue and interaction type, everything before any second "-".
+    r"(?=[^-A-Za-z]*(?P<res2_name>[A-Za-z]+))(?=[^-\d]*(?P<res2_numb>\d+))"
+    r"(?=[^-A-Za-z]*[A-Za-z]+[^-A-Za-z]+(?P<interaction>[A-Za-z]+))"
+)
+
+# Substitutions made to the text of a PyContact GUI file before it is parsed.
+_GUI_FILE_REPLACEMENTS = {
+    "[": ",", "]": ",",
+    "hbond": "Hbond,", "hydrophobic": "Hydrophobic,", "other": "Other,", "saltbr": "Saltbr,"
+}
+_GUI_FILE_PATTERN = re.compile(r"\[|\]| {2,}|hbond|hydrophobic|other|saltbr")
 
 
 @dataclass
@@ -81,8 +102,11 @@ class PyContactInitializer():
             self.in_dir += "/"
 
         if self.multiple_files:
-            individ_dfs = [self._load_pycontact_dataset(
-                i) for i in self.pycontact_files]
+            # Replicas/blocks are only combined after loading, so read them side by side.
+            # map() returns them in the order given, which the merges depend on.
+            with ThreadPoolExecutor(max_workers=min(4, len(self.pycontact_files))) as executor:
+                individ_dfs = list(executor.map(
+                    self._load_pycontact_dataset, self.pycontact_files))
 
             if self.merge_files_method == "vertical":
                 full_df = self._merge_pycontact_datasets_vertically(
@@ -163,16 +187,13 @@ class PyContactInitializer():
         with open(pycontact_gui_file, 'r', encoding="utf-8") as file:
             filedata = file.read()
 
-        filedata = filedata.replace("[", ",").replace("]", ",")
-        # Removing any double or more spaces and tabs etc...
-        filedata = re.sub(' +', ' ', filedata)
-
-        # Standardize formatting.
-        filedata = filedata.replace("hbond", "Hbond,").replace(
-            "hydrophobic", "Hydrophobic,").replace("other", "Other,").replace("saltbr", "Saltbr,")
+        # Standardize formatting and remove any double or more spaces, all in one pass.
+        filedata = _GUI_FILE_PATTERN.sub(
+            lambda match: _GUI_FILE_REPLACEMENTS.get(match[0], " "), filedata)
         file_data_list = (filedata.split("\n"))[1:]  # skip top row of headers.
 
-        all_features = {}
+        feature_names = []
+        feature_scores = []
         for line in file_data_list:
             feature = line.split(",")[0]
 
@@ -190,11 +211,17 @@ class PyContactInitializer():
                     break
 
             if scores_flt:  # otherwise get an empty feature at the end.
-                feature_cleaned = self._clean_gui_feature_name(
-                    feature_name=feature)
-                all_features.update({feature_cleaned: scores_flt})
+                feature_names.append(feature)
+                feature_scores.append(scores_flt)
+
+        features_cleaned = self._clean_gui_feature_names(feature_names=feature_names)
+        all_features = dict(zip(features_cleaned, feature_scores))
+        if not all_features:
+            return pd.DataFrame()
 
-        return pd.DataFrame.from_dict(all_features)
+        # One row per feature in the file, transposed so each feature is a column.
+        scores_arr = np.array(list(all_features.values()), dtype=np.float64)
+        return pd.DataFrame(scores_arr.T, columns=list(all_features))
 
     @staticmethod
     def _merge_pycontact_datasets_horizontally(individ_dfs: list) -> pd.DataFrame:
@@ -229,7 +256,8 @@ class PyContactInitializer():
             raise ValueError(except_message)
 
         merged_df = pd.concat(individ_dfs, axis=1)
-        merged_df = merged_df.fillna(0.0)
+        if merged_df.isna().any(axis=None):
+            merged_df = merged_df.fillna(0.0)
         return merged_df
 
     @staticmethod
@@ -250,9 +278,10 @@ class PyContactInitializer():
         pd.DataFrame
             Complete df with individual dfs merged in the same order as they were provided.
         """
-        merged_df = pd.concat(
-            individ_dfs, ignore_index='True', sort='False')
-        merged_df = merged_df.fillna(0.0)
+        merged_df = pd.concat(individ_dfs, ignore_index=True, sort=False)
+        # Features missing from some of the files are set to 0.0 for those frames.
+        if merged_df.isna().any(axis=None):
+            merged_df = merged_df.fillna(0.0)
         return merged_df
 
     @staticmethod
@@ -364,9 +393,9 @@ class PyContactInitializer():
         return prepared_df
 
     @staticmethod
-    def _clean_gui_feature_name(feature_name: str) -> str:
+    def _clean_gui_feature_names(feature_names: list) -> list:
         """
-        Reformats a feature name from how it is labelled in the GUI output of PyContact
+        Reformats the feature names from how they are labelled in the GUI output of PyContact
         to the standardized way that is expected throughout this program.
 
         Note that with the GUI, it is not possible to save whether the interaction
@@ -377,27 +406,31 @@ class PyContactInitializer():
         Parameters
         ----------
 
-        feature_name: str
-            GUI formatted feature to reformat.
+        feature_names: list
+            GUI formatted features to reformat.
 
         Returns
         ----------
 
-        str
-            Reformatted feature name.
+        list
+            Reformatted feature names.
         """
-        res1 = feature_name.split('-')[0]
-        res1_numb = re.findall(r'\d+', res1)[0]
-        res1_name = (re.findall(r'[A-Z|a-z]+', res1)[0]).capitalize()
+        names = pd.Series(feature_names, dtype=object)
+        parts = names.str.extract(_GUI_FEATURE_PATTERN)
 
-        res2_plus_info = feature_name.split('-')[1]
-        res2_numb = re.findall(r'\d+', res2_plus_info)[0]
-        res2_name = (re.findall(r'[A-Z|a-z]+', res2_plus_info)[0]).capitalize()
+        # Every group is captured if the pattern matched at all.
+        unmatched = parts["interaction"].isna()
+        if unmatched.any():
+            raise ValueError(
+                f"Could not reformat the PyContact GUI feature: {names[unmatched].iloc[0]}")
 
         # info is interaction type (e.g. Hbond, Vdw etc...)
-        info = (re.findall(r'[A-Z|a-z]+', res2_plus_info)[1]).capitalize()
-
-        return res1_numb + res1_name + " " + res2_numb + res2_name + " " + info + " bb-bb"
+        cleaned_names = (
+            parts["res1_numb"] + parts["res1_name"].str.capitalize() + " " +
+            parts["res2_numb"] + parts["res2_name"].str.capitalize() + " " +
+            parts["interaction"].str.capitalize() + " bb-bb"
+        )
+        return cleaned_names.tolist()
 
 
 def modify_column_residue_numbers(dataset: pd.DataFrame, constant_to_add: int = 1) -> pd.DataFrame:
@@ -351,7 +351,7 @@ class ClassificationStatModel(_ProteinStatModel):
 
             js_dist = np.around(jensenshannon(distrib_1, distrib_2, base=2), 5)
 
-            self.js_distances.update({feature: js_dist})
+            self.js_distances[feature] = js_dist
 
         self.js_distances = {k: v for k, v in sorted(
             self.js_distances.items(), key=lambda item: item[1], reverse=True)}
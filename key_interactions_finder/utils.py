@@ -100,7 +100,7 @@ def per_residue_distance_to_site(pdb_file: str,
 
                 min_res_dist = np.round(res_dist_arr.min(), 2)
 
-            min_dists.update({residue: min_res_dist})
+            min_dists[residue] = min_res_dist
 
     else:  # both side and main chain route.
         for residue in range(first_residue, last_residue+1):
@@ -111,7 +111,7 @@ def per_residue_distance_to_site(pdb_file: str,
                 group1.positions, group2.positions, box=universe.dimensions)
 
             min_res_dist = np.round(res_dist_arr.min(), 2)
-            min_dists.update({residue: min_res_dist})
+            min_dists[residue] = min_res_dist
 
     if out_file is None:
         return min_dists
@@ -15,7 +15,7 @@ setup(
     url="https://github.com/kamerlinlab/KIF",
     packages=find_packages(include=["key_interactions_finder"]),
     install_requires=[
-        "pandas",
+        "pandas>=1.5",
         "numpy",
         "scikit-learn",
         "scipy",
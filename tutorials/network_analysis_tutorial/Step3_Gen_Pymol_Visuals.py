@@ -5,7 +5,10 @@ WISP calculation performed with Bio3D (generated with R).
 Bio3D can already make a VMD compatible visulisation file with the following command:
 "vmd.cnapath()"
 """
+from collections import Counter
+from itertools import islice
 from typing import Tuple
+import re
 
 # 3 Adjustable arguments below - UPDATE THESE.
 
@@ -16,6 +19,12 @@ PATHS_FILE = "WISP_Results/PathGlu200Site_all_paths.txt"
 # Output.
 OUT_FILE = "WISP_Results/PathGlu200Site_pymol.py"
 
+# Whitespace separated tokens that are whole integers, i.e. the residues on a path.
+_PATH_MEMBER_PATTERN = re.compile(r"(?<!\S)[-+]?\d+(?!\S)")
+
+# The PyMOL script is written through a 1 MiB buffer, so it takes only a few writes.
+_OUT_FILE_BUFFER_SIZE = 1024 * 1024
+
 
 def parse_vmd_file(vmd_file: str) -> list:
     """
@@ -31,13 +40,17 @@ def parse_vmd_file(vmd_file: str) -> list:
     list
         List of all residues that are on any of the suboptimal paths.
     """
-    mol_selections = []
+    # Path residues are in the third "mol selection" line, so stop reading once it is found.
+    num_selections = 0
     with open(vmd_file, "r", encoding="utf-8") as file_in:
         for line in file_in:
             if "mol selection " in line:
-                mol_selections.append(line)
+                num_selections += 1
+                if num_selections == 3:
+                    return [int(s) for s in line.split() if s.isdigit()]
 
-    return [int(s) for s in mol_selections[2].split() if s.isdigit()]
+    raise ValueError(
+        f"Expected at least 3 'mol selection' lines in {vmd_file} but found {num_selections}.")
 
 
 def parse_all_paths_file(paths_file: str) -> Tuple[list, list]:
@@ -64,14 +77,8 @@ def parse_all_paths_file(paths_file: str) -> Tuple[list, list]:
     all_paths = []
     with open(paths_file, "r", encoding="utf-8") as file_in:
         for line in file_in:
-            split_line = line.split()
-
-            path = []
-            for member in split_line:
-                try:
-                    path.append(int(member))
-                except ValueError:
-                    pass  # non path members caught.
+            # non path members are not matched.
+            path = list(map(int, _PATH_MEMBER_PATTERN.findall(line)))
 
             if len(path) != 0:
                 all_paths_concat.extend(path)
@@ -97,14 +104,11 @@ def prep_res_counts(all_paths_concat: list) -> dict:
     """
 
     # Generate a dict of each residue and its frequenecy of occurence.
-    res_counts = dict((x, all_paths_concat.count(x))
-                      for x in set(all_paths_concat))
+    res_counts = Counter(all_paths_concat)
     # scale items in dict so max value = 1
     max_val = max(res_counts.values())
-    res_counts.update((k, round(v / max_val, 4))
-                      for k, v in res_counts.items())
 
-    return res_counts
+    return {k: round(v / max_val, 4) for k, v in res_counts.items()}
 
 
 def prep_res_res_connections(all_paths: list) -> dict:
@@ -120,35 +124,21 @@ def prep_res_res_connections(all_paths: list) -> dict:
     Returns
     ----------
     dict
-        Keys are residue-residue pairs and values are their normalised frequency.
+        Keys are (lower, higher) residue number tuples of each residue-residue pair
+        and values are their normalised frequency.
         Max frequency value is 0.5 (good for pymol).
     """
-    interacting_pairs = {}
+    interacting_pairs = Counter()
     for path in all_paths:
-        for res1, res2 in zip(path, path[1:]):
-            # catch both possible res number orderings..
-            pair_v1 = str(res1) + " " + str(res2)
-            pair_v2 = str(res2) + " " + str(res1)
-
-            if pair_v1 in interacting_pairs:
-                interacting_pairs[pair_v1] += 1
-
-            elif pair_v2 in interacting_pairs:
-                # except happens if pair_v2 occurs before pair_v1 in list.
-                try:
-                    interacting_pairs[pair_v1] += 1
-                except KeyError:
-                    interacting_pairs[pair_v1] = 1
-
-            else:
-                interacting_pairs[pair_v1] = 1
+        for res1, res2 in zip(path, islice(path, 1, None)):
+            # both possible res number orderings count as the same connection.
+            pair = (res1, res2) if res1 < res2 else (res2, res1)
+            interacting_pairs[pair] += 1
 
     # scale items in dict so max value = 0.5
     max_interactions = max(interacting_pairs.values())
-    interacting_pairs.update((k, round(v / (max_interactions*2), 4))
-                             for k, v in interacting_pairs.items())
 
-    return interacting_pairs
+    return {k: round(v / (max_interactions*2), 4) for k, v in interacting_pairs.items()}
 
 
 def main():
@@ -160,38 +150,33 @@ def main():
     res_counts = prep_res_counts(all_paths_concat=all_paths_concat)
 
     # Write the pymol file.
-    pymol_out_text = ""
-    pymol_out_text += "# To run this script you will need to get a copy of 'draw_links.py' \n"
-    pymol_out_text += "# You can find it freely available here: \n"
-    pymol_out_text += "# http://pldserver1.biochem.queensu.ca/~rlc/work/pymol/draw_links.py \n"
-    pymol_out_text += "# Place the 'draw_links.py' file in your working directory. \n"
-    pymol_out_text += "run draw_links.py\n"
+    pymol_out_lines = [
+        "# To run this script you will need to get a copy of 'draw_links.py' \n",
+        "# You can find it freely available here: \n",
+        "# http://pldserver1.biochem.queensu.ca/~rlc/work/pymol/draw_links.py \n",
+        "# Place the 'draw_links.py' file in your working directory. \n",
+        "run draw_links.py\n",
+    ]
 
     # sticks for all path residues
-    pymol_out_text += "sele path_residues, resi "
-    for residue in path_residues:
-        pymol_out_text += f"{residue}+"
-    pymol_out_text += " \n"
-    pymol_out_text += "show sticks, path_residues \n"
+    pymol_out_lines.append(f"sele path_residues, resi {'+'.join(map(str, path_residues))} \n")
+    pymol_out_lines.append("show sticks, path_residues \n")
 
     # spheres for all network residues, with sizes scaled by frequency.
-    for res_numb, sphere_size in res_counts.items():
-        pymol_out_text += f"show spheres, resi {res_numb} and name CA\n"
-        pymol_out_text += f"set sphere_scale, {sphere_size:.4f}, resi {res_numb} and name CA\n"
-
-    for res_combo, cylider_size in interacting_pairs.items():
-        residues = res_combo.split()
+    # Residues and connections are written in ascending residue order so the output is stable.
+    sphere_template = ("show spheres, resi {0} and name CA\n" +
+                       "set sphere_scale, {1:.4f}, resi {0} and name CA\n")
+    pymol_out_lines.extend(sphere_template.format(res_numb, sphere_size)
+                           for res_numb, sphere_size in sorted(res_counts.items()))
 
-        pymol_out_text += (f"draw_links selection1=resi {residues[0]}, " +
-                           f"selection2=resi {residues[1]}, " +
-                           "color=grey, " +
-                           f"radius={cylider_size} \n"
-                           )
-    pymol_out_text += "group Paths, link*"
+    link_template = "draw_links selection1=resi {0}, selection2=resi {1}, color=grey, radius={2} \n"
+    pymol_out_lines.extend(link_template.format(res1, res2, cylider_size)
+                           for (res1, res2), cylider_size in sorted(interacting_pairs.items()))
+    pymol_out_lines.append("group Paths, link*")
 
     # Finally save.
-    with open(OUT_FILE, "w+", encoding="utf-8") as file_out:
-        file_out.write(pymol_out_text)
+    with open(OUT_FILE, "w", encoding="utf-8", buffering=_OUT_FILE_BUFFER_SIZE) as file_out:
+        file_out.write("".join(pymol_out_lines))
 
 
 if __name__ == "__main__":